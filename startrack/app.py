@@ -3,56 +3,147 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from startrack.config import (
+    DEFAULT_MAX_WORKERS,
     GITHUB_TOKEN_ENV,
     INPUT_ORGANIZATIONS_ENV,
     INPUT_OUTPUT_FILENAME_ENV,
     INPUT_OUTPUT_PATH_ENV,
     INPUT_PYPI_PACKAGES_ENV,
     INPUT_REPOSITORIES_ENV,
+    MAX_WORKERS_ENV,
     PYPI_OUTPUT_FILENAME_ENV,
 )
 from startrack.core import (
     RepositoryData,
     RepositoryType,
-    convert_repositories_to_dataframe,
     fetch_all_organization_repositories,
-    fetch_repository_data_by_full_name,
-)
-from startrack.pypi import (
-    PyPIPackageData,
-    fetch_all_pypi_stats,
+    fetch_repositories_graphql,
 )
+from startrack.pypi import fetch_all_pypi_stats
 
 GITHUB_TOKEN = os.environ.get(GITHUB_TOKEN_ENV)
-ORGANIZATIONS = os.environ.get(INPUT_ORGANIZATIONS_ENV, "")
-REPOSITORIES = os.environ.get(INPUT_REPOSITORIES_ENV, "")
 OUTPUT_PATH = os.environ.get(INPUT_OUTPUT_PATH_ENV, "data")
 OUTPUT_FILENAME = os.environ.get(INPUT_OUTPUT_FILENAME_ENV, "github_data.csv")
-
-PYPI_PACKAGES = os.environ.get(INPUT_PYPI_PACKAGES_ENV, "")
 PYPI_OUTPUT_FILENAME = os.environ.get(PYPI_OUTPUT_FILENAME_ENV, "pypi_data.csv")
 
-ORGANIZATION_NAMES = [org.strip() for org in ORGANIZATIONS.split(",") if org.strip()]
-REPOSITORY_NAMES = [repo.strip() for repo in REPOSITORIES.split(",") if repo.strip()]
-PYPI_PACKAGE_NAMES = [pkg.strip() for pkg in PYPI_PACKAGES.split(",") if pkg.strip()]
+CSV_SUFFIX = ".csv"
+CSV_CHUNK_SIZE = 10_000
+PARQUET_SUFFIX = ".parquet"
+FEATHER_SUFFIX = ".feather"
+FEATHER_INDEX_COLUMN = "date"
+
 
+def _parse_csv_env(name: str, default: str = "") -> list[str]:
+    """Split a comma-separated environment variable into a list of stripped names."""
+    value = os.environ.get(name, default)
+    return [item.strip() for item in value.split(",") if item.strip()]
 
-def save_to_csv(df: pd.DataFrame, directory: str, filename: str) -> None:
-    """Save a DataFrame to a CSV file in the specified directory.
+
+def save_to_file(df: pd.DataFrame, directory: str, filename: str) -> None:
+    """Save a DataFrame to a file in the specified directory.
+
+    The format is picked from the file extension: `.parquet` and `.feather` files are
+    written with pyarrow, anything else is written as CSV, compressed when the name
+    ends with a compression extension such as `.gz`.
 
     Args:
         df (pd.DataFrame): The DataFrame to save.
-        directory (str): The directory where the CSV file will be saved.
-        filename (str): The name of the CSV file.
+        directory (str): The directory where the file will be saved.
+        filename (str): The name of the file.
+    """
+    directory_path = Path(directory)
+    directory_path.mkdir(parents=True, exist_ok=True)
+
+    file_path = directory_path / filename
+    if file_path.suffix == PARQUET_SUFFIX:
+        df.to_parquet(file_path, compression="zstd")
+    elif file_path.suffix == FEATHER_SUFFIX:
+        # Feather cannot store a custom index, so keep the dates as a regular column.
+        df.rename_axis(FEATHER_INDEX_COLUMN).reset_index().to_feather(file_path)
+    else:
+        df.to_csv(file_path, chunksize=CSV_CHUNK_SIZE, compression="infer")
+
+
+def read_history(file_path: Path) -> pd.DataFrame:
+    """Read a history file written by `save_to_file`.
+
+    Args:
+        file_path (Path): The path of the history file.
+
+    Returns:
+        pd.DataFrame: The stored history, indexed by date.
     """
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    if file_path.suffix == PARQUET_SUFFIX:
+        return pd.read_parquet(file_path)
+    if file_path.suffix == FEATHER_SUFFIX:
+        df = pd.read_feather(file_path).set_index(FEATHER_INDEX_COLUMN)
+        return df.rename_axis(None)
+    return pd.read_csv(file_path, index_col=0)
+
 
-    file_path = os.path.join(directory, filename)
-    df.to_csv(file_path)
+def fast_concat(existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Stack two DataFrames whose columns may differ, without `pd.concat`.
+
+    Columns keep the order of `existing`, followed by columns only present in `new`.
+
+    Args:
+        existing (pd.DataFrame): The DataFrame whose rows come first.
+        new (pd.DataFrame): The DataFrame whose rows are added below.
+
+    Returns:
+        pd.DataFrame: The combined DataFrame, with missing values set to NaN.
+    """
+    added_columns = new.columns.difference(existing.columns, sort=False)
+    columns = existing.columns.append(added_columns)
+    top = existing.reindex(columns=columns)
+    bottom = new.reindex(columns=columns)
+    # Stack column by column so each keeps its own dtype, like `pd.concat` does: fully
+    # populated integer columns stay int64 and only columns with gaps become floats.
+    data = {
+        column: np.concatenate([top[column].to_numpy(), bottom[column].to_numpy()])
+        for column in columns
+    }
+    index = existing.index.append(new.index)
+    return pd.DataFrame(data, index=index, columns=columns)
+
+
+def update_history(df: pd.DataFrame, directory: str, filename: str) -> None:
+    """Add a single day of data to the history file in the specified directory.
+
+    For uncompressed CSV files that already track exactly the same columns and have
+    no row for that day, the row is appended in place. Otherwise the history is
+    loaded, merged and rewritten.
+
+    Args:
+        df (pd.DataFrame): A single-row DataFrame indexed by the current date.
+        directory (str): The directory where the history file is stored.
+        filename (str): The name of the history file.
+    """
+    file_path = Path(directory) / filename
+    if not file_path.exists():
+        save_to_file(df=df, directory=directory, filename=filename)
+        return
+
+    current_date = df.index[0]
+    if file_path.suffix == CSV_SUFFIX:
+        existing_columns = pd.read_csv(file_path, index_col=0, nrows=0).columns
+        same_columns = len(existing_columns) == len(df.columns)
+        if same_columns and existing_columns.isin(df.columns).all():
+            existing_dates = pd.read_csv(file_path, index_col=0, usecols=[0]).index
+            if current_date not in existing_dates:
+                df[existing_columns].to_csv(file_path, mode="a", header=False)
+                return
+
+    existing_df = read_history(file_path)
+    if current_date in existing_df.index:
+        existing_df = existing_df.drop(current_date)
+    df = fast_concat(existing_df, df)
+
+    save_to_file(df=df, directory=directory, filename=filename)
 
 
 def fetch_organization_repositories(organization_name: str) -> list[RepositoryData]:
@@ -62,22 +153,22 @@ def fetch_organization_repositories(organization_name: str) -> list[RepositoryDa
         organization_name=organization_name,
         repository_type=RepositoryType.PUBLIC,
     )
-    return [RepositoryData.from_json(repo) for repo in raw_repos]
+    return RepositoryData.from_json_list(raw_repos)
 
 
-def fetch_individual_repository(repo_full_name: str) -> RepositoryData:
-    repo_data = fetch_repository_data_by_full_name(
-        github_token=GITHUB_TOKEN,
-        repository_full_name=repo_full_name,
-    )
-    if repo_data:
-        return RepositoryData.from_json(repo_data)
-    return None
-
-
-def get_all_repositories() -> list[RepositoryData]:
+def get_all_repositories(
+    organization_names: list[str],
+    repository_names: list[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[RepositoryData]:
     """Fetch all repositories from specified organizations and individual repositories.
 
+    Args:
+        organization_names (list[str]): Names of the organizations to fetch.
+        repository_names (list[str]): Full names (owner/repo) of individual
+            repositories to fetch.
+        max_workers (int): The maximum number of fetches to run at once.
+
     Returns:
         List[RepositoryData]: A list of repository data objects.
     """
@@ -85,35 +176,60 @@ def get_all_repositories() -> list[RepositoryData]:
     failed_orgs = []
     failed_repos = []
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        organization_futures = {
-            executor.submit(fetch_organization_repositories, org_name): org_name
-            for org_name in ORGANIZATION_NAMES
-        }
-
-        repository_futures = {
-            executor.submit(fetch_individual_repository, repo_name): repo_name
-            for repo_name in REPOSITORY_NAMES
-        }
-
-        for future in concurrent.futures.as_completed(organization_futures):
-            org_name = organization_futures[future]
+    organization_names = list(dict.fromkeys(organization_names))
+    repository_names = list(dict.fromkeys(repository_names))
+
+    # Repositories owned by a tracked organization are usually part of its listing,
+    # so they are only fetched individually once the listings are in. The others
+    # can be fetched right away.
+    tracked_orgs = {org_name.lower() for org_name in organization_names}
+    independent_repos = []
+    overlapping_repos = []
+    for repo_name in repository_names:
+        owner = repo_name.partition("/")[0].lower()
+        if owner in tracked_orgs:
+            overlapping_repos.append(repo_name)
+        else:
+            independent_repos.append(repo_name)
+
+    # Fetches are IO-bound, so run as many as configured rather than one per CPU.
+    task_count = len(organization_names) + bool(independent_repos)
+    max_workers = max(1, min(task_count, max_workers))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for org_name in organization_names:
+            future = executor.submit(fetch_organization_repositories, org_name)
+            futures[future] = ("org", org_name)
+        if independent_repos:
+            # Individual repositories are looked up together in batched GraphQL
+            # queries rather than with one REST call each.
+            future = executor.submit(
+                fetch_repositories_graphql, GITHUB_TOKEN, independent_repos
+            )
+            futures[future] = ("repos", ", ".join(independent_repos))
+
+        for future in concurrent.futures.as_completed(futures):
+            kind, name = futures[future]
             try:
-                repos = future.result()
-                all_repositories.extend(repos)
+                all_repositories.extend(future.result())
             except Exception as e:
-                failed_orgs.append(org_name)
-                print(f"ERROR: Failed to fetch org '{org_name}': {e}")
-
-        for future in concurrent.futures.as_completed(repository_futures):
-            repo_name = repository_futures[future]
-            try:
-                repo_data = future.result()
-                if repo_data:
-                    all_repositories.append(repo_data)
-            except Exception as e:
-                failed_repos.append(repo_name)
-                print(f"ERROR: Failed to fetch repo '{repo_name}': {e}")
+                if kind == "org":
+                    failed_orgs.append(name)
+                else:
+                    failed_repos.extend(independent_repos)
+                print(f"ERROR: Failed to fetch {kind} '{name}': {e}")
+
+    seen = {repository.full_name.lower() for repository in all_repositories}
+    remaining_repos = [name for name in overlapping_repos if name.lower() not in seen]
+    if remaining_repos:
+        try:
+            all_repositories.extend(
+                fetch_repositories_graphql(GITHUB_TOKEN, remaining_repos)
+            )
+        except Exception as e:
+            failed_repos.extend(remaining_repos)
+            print(f"ERROR: Failed to fetch repos '{', '.join(remaining_repos)}': {e}")
 
     if failed_orgs or failed_repos:
         print(f"WARNING: Failed to fetch {len(failed_orgs)} orgs and {len(failed_repos)} repos")
@@ -121,21 +237,26 @@ def get_all_repositories() -> list[RepositoryData]:
     return all_repositories
 
 
-def convert_pypi_to_dataframe(packages: list[PyPIPackageData]) -> pd.DataFrame:
-    """Convert a list of PyPIPackageData objects into a pandas DataFrame.
+def build_daily_row(
+    names: list[str],
+    values: list[int],
+    current_date: str,
+) -> pd.DataFrame:
+    """Build a single-row DataFrame holding one day of tracked values.
 
     Args:
-        packages: A list of PyPIPackageData objects.
+        names (list[str]): The column names, e.g. repository or package names.
+        values (list[int]): The value for each name, in the same order.
+        current_date (str): The date used as the row index.
 
     Returns:
-        pd.DataFrame: A DataFrame with package names as columns and downloads as values.
+        pd.DataFrame: A DataFrame with the names as columns and one row for the date.
     """
-    data = [{"name": pkg.name, "daily_downloads": pkg.daily_downloads} for pkg in packages]
-    return pd.DataFrame(data)
+    return pd.DataFrame([values], index=[current_date], columns=names)
 
 
 def main() -> None:
-    """Main function to fetch repository and PyPI data, and save to CSV files."""
+    """Main function to fetch repository and PyPI data, and save them to disk."""
     if not GITHUB_TOKEN:
         msg = (
             "`GITHUB_TOKEN` is not set. Please set the `GITHUB_TOKEN` environment "
@@ -143,8 +264,12 @@ def main() -> None:
         )
         raise ValueError(msg)
 
-    has_github_tracking = ORGANIZATION_NAMES or REPOSITORY_NAMES
-    has_pypi_tracking = bool(PYPI_PACKAGE_NAMES)
+    organization_names = _parse_csv_env(INPUT_ORGANIZATIONS_ENV)
+    repository_names = _parse_csv_env(INPUT_REPOSITORIES_ENV)
+    pypi_package_names = _parse_csv_env(INPUT_PYPI_PACKAGES_ENV)
+
+    has_github_tracking = organization_names or repository_names
+    has_pypi_tracking = bool(pypi_package_names)
 
     if not has_github_tracking and not has_pypi_tracking:
         msg = (
@@ -153,41 +278,40 @@ def main() -> None:
         )
         raise ValueError(msg)
 
+    try:
+        max_workers = int(os.environ.get(MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS))
+    except ValueError:
+        value = os.environ[MAX_WORKERS_ENV]
+        msg = f"`{MAX_WORKERS_ENV}` must be an integer, got {value!r}."
+        raise ValueError(msg) from None
+
     current_date = datetime.now().strftime("%Y-%m-%d")
 
     # Track GitHub stars
     if has_github_tracking:
-        repositories = get_all_repositories()
-        df = convert_repositories_to_dataframe(repositories)
-        df = df.set_index("full_name").T
-        df.index = [current_date]
-
-        file_path = Path(OUTPUT_PATH) / OUTPUT_FILENAME
-        if file_path.exists():
-            existing_df = pd.read_csv(file_path, index_col=0)
-            if current_date in existing_df.index:
-                existing_df = existing_df.drop(current_date)
-            df = pd.concat([existing_df, df])
+        repositories = get_all_repositories(
+            organization_names, repository_names, max_workers=max_workers
+        )
+        df = build_daily_row(
+            names=[repository.full_name for repository in repositories],
+            values=[repository.star_count for repository in repositories],
+            current_date=current_date,
+        )
 
-        save_to_csv(df=df, directory=OUTPUT_PATH, filename=OUTPUT_FILENAME)
+        update_history(df=df, directory=OUTPUT_PATH, filename=OUTPUT_FILENAME)
 
     # Track PyPI downloads
     if has_pypi_tracking:
-        pypi_stats = fetch_all_pypi_stats(PYPI_PACKAGE_NAMES)
+        pypi_stats = fetch_all_pypi_stats(pypi_package_names)
 
         if pypi_stats:
-            df = convert_pypi_to_dataframe(pypi_stats)
-            df = df.set_index("name").T
-            df.index = [current_date]
-
-            file_path = Path(OUTPUT_PATH) / PYPI_OUTPUT_FILENAME
-            if file_path.exists():
-                existing_df = pd.read_csv(file_path, index_col=0)
-                if current_date in existing_df.index:
-                    existing_df = existing_df.drop(current_date)
-                df = pd.concat([existing_df, df])
-
-            save_to_csv(df=df, directory=OUTPUT_PATH, filename=PYPI_OUTPUT_FILENAME)
+            df = build_daily_row(
+                names=[package.name for package in pypi_stats],
+                values=[package.daily_downloads for package in pypi_stats],
+                current_date=current_date,
+            )
+
+            update_history(df=df, directory=OUTPUT_PATH, filename=PYPI_OUTPUT_FILENAME)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class _PersistentStore:
+    """Thread-safe dictionary of JSON-serializable entries that can be persisted."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, file_path: Path) -> None:
+        """Load entries from a JSON file, ignoring a missing or corrupt file.
+
+        Args:
+            file_path (Path): The path of the cache file.
+        """
+        try:
+            entries = orjson.loads(file_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache {file_path}: {e}")
+            return
+
+        with self._lock:
+            self._entries.update(entries)
+
+    def save(self, file_path: Path) -> None:
+        """Write all entries to a JSON file.
+
+        Args:
+            file_path (Path): The path of the cache file.
+        """
+        with self._lock:
+            data = orjson.dumps(self._entries)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(data)
+
+
+class ETagCache(_PersistentStore):
+    """Thread-safe store of HTTP `ETag` values and the payloads they validate.
+
+    Entries are keyed by an arbitrary string (usually the request URL) and can be
+    persisted as JSON between runs, so that unchanged resources can be revalidated
+    with `If-None-Match` instead of being downloaded and parsed again.
+    """
+
+    def get(self, key: str) -> tuple[str, Any] | None:
+        """Return the cached `(etag, payload)` pair for a key, if any.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            tuple[str, Any] | None: The stored ETag and payload, or None if missing.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry["etag"], entry["payload"]
+
+    def set(self, key: str, etag: str | None, payload: Any) -> None:  # noqa: ANN401
+        """Store the payload validated by an ETag. Responses without one are skipped.
+
+        Args:
+            key (str): The cache key.
+            etag (str | None): The `ETag` header of the response.
+            payload (Any): A JSON-serializable payload to return on `304` responses.
+        """
+        if not etag:
+            return
+        with self._lock:
+            self._entries[key] = {"etag": etag, "payload": payload}
+
+
+class ResponseCache(_PersistentStore):
+    """Thread-safe store of decoded responses that expire after a given age.
+
+    Used for slowly-changing lookups, so that repeated runs do not download the same
+    data again. `None` is a valid cached value, e.g. for files known to be missing.
+    """
+
+    def get(self, key: str, max_age: float) -> tuple[bool, Any]:
+        """Return a cached value if it is younger than `max_age` seconds.
+
+        Args:
+            key (str): The cache key.
+            max_age (float): The maximum age of the entry, in seconds.
+
+        Returns:
+            tuple[bool, Any]: Whether a fresh entry was found, and its value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.time() - entry["stored_at"] > max_age:
+            return False, None
+        return True, entry["value"]
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store a value under a key, stamped with the current time.
+
+        Args:
+            key (str): The cache key.
+            value (Any): A JSON-serializable value.
+        """
+        with self._lock:
+            self._entries[key] = {"stored_at": time.time(), "value": value}
@@ -1,10 +1,31 @@
 GITHUB_TOKEN_ENV = "GITHUB_TOKEN"  # noqa: S105
+GITHUB_TOKENS_ENV = "GITHUB_TOKENS"
+TOKEN_MIN_REMAINING = 10
 INPUT_ORGANIZATIONS_ENV = "INPUT_ORGANIZATIONS"
 INPUT_REPOSITORIES_ENV = "INPUT_REPOSITORIES"
 
 INPUT_OUTPUT_PATH_ENV = "INPUT_OUTPUT_PATH"
 INPUT_OUTPUT_FILENAME_ENV = "INPUT_OUTPUT_FILENAME"
+ETAG_CACHE_FILENAME = ".etag_cache.json"
 HTTP_REQUEST_TIMEOUT = 30
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+HTTP_MAX_RETRIES = 5
+PAGE_FETCH_MAX_WORKERS = 8
+GITHUB_MAX_CONCURRENT_REQUESTS = 20
+RATE_LIMIT_PACING_THRESHOLD = 500
+GITHUB_PER_PAGE = 100
+GRAPHQL_BATCH_SIZE = 50
+DISCOVERY_MAX_WORKERS = 10
 
 INPUT_PYPI_PACKAGES_ENV = "INPUT_PYPI_PACKAGES"
 PYPI_OUTPUT_FILENAME_ENV = "INPUT_PYPI_OUTPUT_FILENAME"
+PYPI_MAX_WORKERS = 4
+PYPI_MAX_RETRY_AFTER = 60
+
+RESPONSE_CACHE_FILENAME = ".startrack_cache.json"
+PYPI_STATS_CACHE_TTL = 60 * 60
+GITHUB_FILE_CACHE_TTL = 24 * 60 * 60
+
+MAX_WORKERS_ENV = "STARTRACK_MAX_WORKERS"
+DEFAULT_MAX_WORKERS = 20
@@ -1,18 +1,115 @@
+import concurrent.futures
+import functools
+import itertools
 import logging
+import operator
+import random
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
+from urllib.parse import parse_qs, urlparse
 
-import pandas as pd
+import orjson
 import requests
-
-from startrack.config import HTTP_REQUEST_TIMEOUT
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+from startrack.cache import ETagCache
+from startrack.config import (
+    GITHUB_MAX_CONCURRENT_REQUESTS,
+    GITHUB_PER_PAGE,
+    GRAPHQL_BATCH_SIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_REQUEST_TIMEOUT,
+    PAGE_FETCH_MAX_WORKERS,
+    RATE_LIMIT_PACING_THRESHOLD,
+    TOKEN_MIN_REMAINING,
+)
 
 logger = logging.getLogger(__name__)
 
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+
+def create_session() -> requests.Session:
+    """Create a `requests.Session` backed by a keep-alive connection pool.
+
+    Returns:
+        requests.Session: A session whose HTTPS adapter reuses TLS connections
+            across requests and worker threads and retries transient failures.
+    """
+    session = requests.Session()
+    # Transient gateway errors are retried with exponential backoff, preferring the
+    # server's `Retry-After`. Rate-limit responses (403/429) are left to
+    # `handle_rate_limit`, so the pause is shared across threads through
+    # `RATE_LIMITER` instead of being slept out inside a single request.
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=1,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    # Advertise every encoding urllib3 can decode, including brotli when installed.
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+SESSION = create_session()
+ETAG_CACHE = ETagCache()
+
+# Repository fields kept in the ETag cache; enough for every consumer of the listings.
+CACHED_REPOSITORY_FIELDS = ("full_name", "stargazers_count", "forks_count", "fork")
+
+
+def _select_cached_fields(repository: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the repository fields that are stored in the ETag cache."""
+    return {
+        field: repository[field]
+        for field in CACHED_REPOSITORY_FIELDS
+        if field in repository
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def github_headers(github_token: str) -> dict[str, str]:
+    """Build the GitHub REST API request headers for a token.
 
-@dataclass
+    The result is cached per token and shared between calls, so it must not be
+    mutated; copy it to add request-specific headers.
+
+    Args:
+        github_token (str): The GitHub personal access token for authentication.
+
+    Returns:
+        dict[str, str]: The request headers.
+    """
+    return {
+        "Accept": "application/vnd.github+json",
+        "Authorization": f"Bearer {github_token}",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
+
+# Extracts the RepositoryData fields, in declaration order, from a REST payload.
+_REPOSITORY_JSON_FIELDS = operator.itemgetter(
+    "full_name", "stargazers_count", "forks_count"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class RepositoryData:
     """Data class for storing repository information.
 
@@ -36,10 +133,21 @@ class RepositoryData:
         Returns:
             RepositoryData: An instance of RepositoryData.
         """
-        full_name = data["full_name"]
-        star_count = data["stargazers_count"]
-        fork_count = data["forks_count"]
-        return cls(full_name=full_name, star_count=star_count, fork_count=fork_count)
+        return cls(*_REPOSITORY_JSON_FIELDS(data))
+
+    @classmethod
+    def from_json_list(
+        cls: type["RepositoryData"], data: list[dict[str, Any]]
+    ) -> list["RepositoryData"]:
+        """Create RepositoryData instances from a list of JSON dictionaries.
+
+        Args:
+            data (List[Dict[str, Any]]): Dictionaries containing repository data.
+
+        Returns:
+            List[RepositoryData]: One RepositoryData instance per dictionary.
+        """
+        return list(itertools.starmap(cls, map(_REPOSITORY_JSON_FIELDS, data)))
 
 
 class RepositoryType(Enum):
@@ -78,22 +186,67 @@ def fetch_all_organization_repositories(
     Returns:
         List: A list of repositories.
     """
-    all_repositories = []
-    page = 1
-    with requests.Session() as session:
-        while True:
+    try:
+        first_page = _fetch_organization_repositories_page(
+            session=SESSION,
+            github_token=github_token,
+            organization_name=organization_name,
+            repository_type=repository_type,
+            page=1,
+        )
+    except requests.HTTPError as e:
+        logger.error(f"Failed to fetch page 1 for {organization_name}: {e}")
+        return []
+
+    if first_page is None:
+        return []
+
+    all_repositories, last_page = first_page
+    if last_page is None:
+        # Without a `Link` header the page count is unknown, so walk the pages until
+        # one comes back short.
+        page = 1
+        page_size = len(all_repositories)
+        while page_size == GITHUB_PER_PAGE:
+            page += 1
             try:
                 repos = fetch_organization_repositories_by_page(
-                    session=session,
+                    session=SESSION,
                     github_token=github_token,
                     organization_name=organization_name,
                     repository_type=repository_type,
                     page=page,
                 )
-                if not repos:
-                    break
-                all_repositories.extend(repos)
-                page += 1
+            except requests.HTTPError as e:
+                logger.error(
+                    f"Failed to fetch page {page} for {organization_name}: {e}"
+                )
+                break
+            all_repositories.extend(repos)
+            page_size = len(repos)
+        return all_repositories
+
+    if last_page < 2:
+        return all_repositories
+
+    pages = range(2, last_page + 1)
+    max_workers = min(len(pages), PAGE_FETCH_MAX_WORKERS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                fetch_organization_repositories_by_page,
+                session=SESSION,
+                github_token=github_token,
+                organization_name=organization_name,
+                repository_type=repository_type,
+                page=page,
+            )
+            for page in pages
+        ]
+
+        for page, future in zip(pages, futures, strict=True):
+            try:
+                all_repositories.extend(future.result())
             except requests.HTTPError as e:
                 logger.error(
                     f"Failed to fetch page {page} for {organization_name}: {e}"
@@ -103,46 +256,272 @@ def fetch_all_organization_repositories(
     return all_repositories
 
 
-def handle_rate_limit(response: requests.Response) -> bool:
+def _parse_last_page(response: requests.Response) -> int | None:
+    """Extract the last page number from the `Link` header of a paginated response.
+
+    Args:
+        response: The response object from a paginated GitHub API request.
+
+    Returns:
+        int | None: The number of the last page, or None if the response is the only
+            page.
+    """
+    last_link = response.links.get("last")
+    if not last_link:
+        return None
+
+    page = parse_qs(urlparse(last_link["url"]).query).get("page")
+    if not page:
+        return None
+    return int(page[0])
+
+
+class RateLimiter:
+    """Shared gate that paces GitHub requests and holds them back while the rate limit
+    is exhausted.
+
+    Worker threads call `wait` before each request. When one thread learns that the
+    limit is exhausted it calls `pause`, and all threads then wait for the reset
+    instead of spending requests on guaranteed rejections. Once fewer than
+    `RATE_LIMIT_PACING_THRESHOLD` requests remain, `update` spreads the rest evenly
+    until the reset, so the limit is not hit in the first place.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+        # Seconds between requests and the time they apply until, and the next free
+        # slot, per rate-limit resource ("core", "graphql", ...), as each is limited
+        # separately.
+        self._intervals: dict[str, tuple[float, float]] = {}
+        self._next_slots: dict[str, float] = {}
+
+    def pause(self, seconds: float) -> None:
+        """Hold back requests for the given number of seconds.
+
+        Args:
+            seconds (float): How long to pause from now.
+        """
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def update(self, response: requests.Response) -> None:
+        """Adjust the pacing to the rate-limit budget reported by a response.
+
+        Args:
+            response (requests.Response): A response from the GitHub API.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset_time = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset_time is None:
+            return
+
+        resource = response.headers.get("X-RateLimit-Resource", "core")
+        remaining = int(remaining)
+        window = int(reset_time) - time.time()
+        with self._lock:
+            if remaining >= RATE_LIMIT_PACING_THRESHOLD or window <= 0:
+                self._intervals.pop(resource, None)
+            else:
+                expires_at = time.monotonic() + window
+                self._intervals[resource] = (window / max(remaining, 1), expires_at)
+
+    def wait(self, resource: str | None = None) -> None:
+        """Block until the limiter is no longer paused and, when a rate-limit resource
+        is given, until its next paced slot.
+
+        Args:
+            resource (str | None): The rate-limit resource the request counts against,
+                e.g. "core" or "graphql".
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._resume_at)
+            if resource is not None:
+                start = max(start, self._next_slots.get(resource, 0.0))
+                interval, expires_at = self._intervals.get(resource, (0.0, 0.0))
+                if expires_at > now:
+                    self._next_slots[resource] = start + interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+RATE_LIMITER = RateLimiter()
+
+# Organization fetches each page in their own executor, so cap the requests in flight
+# across all of them to stay clear of GitHub's secondary rate limits.
+_REQUEST_SLOTS = threading.BoundedSemaphore(GITHUB_MAX_CONCURRENT_REQUESTS)
+
+
+class TokenPool:
+    """Round-robin over several GitHub tokens to multiply the available rate limit.
+
+    Tokens reported with fewer than `TOKEN_MIN_REMAINING` requests left are skipped
+    until their limit resets. An empty pool leaves requests untouched.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: list[str] = []
+        self._cycle = itertools.cycle(self._tokens)
+        self._reset_at: dict[str, float] = {}
+
+    def configure(self, tokens: list[str]) -> None:
+        """Set the tokens to rotate through.
+
+        Args:
+            tokens (list[str]): GitHub personal access tokens.
+        """
+        with self._lock:
+            self._tokens = list(dict.fromkeys(tokens))
+            self._cycle = itertools.cycle(self._tokens)
+            self._reset_at = {}
+
+    def acquire(self) -> str | None:
+        """Return the next token that still has budget left.
+
+        Returns:
+            str | None: A token, the one that resets soonest if all are depleted, or
+                None if the pool is empty.
+        """
+        with self._lock:
+            if not self._tokens:
+                return None
+            now = time.time()
+            for _ in range(len(self._tokens)):
+                token = next(self._cycle)
+                if self._reset_at.get(token, 0) <= now:
+                    return token
+            return min(self._tokens, key=lambda token: self._reset_at[token])
+
+    def update(self, token: str, response: requests.Response) -> None:
+        """Record the rate-limit state a response reported for a token.
+
+        Args:
+            token (str): The token the request was sent with.
+            response (requests.Response): The response to the request.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None or int(remaining) >= TOKEN_MIN_REMAINING:
+            return
+        reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+        with self._lock:
+            self._reset_at[token] = reset_time
+
+    def has_available(self) -> bool:
+        """Return whether any token still has budget left."""
+        now = time.time()
+        with self._lock:
+            return any(self._reset_at.get(token, 0) <= now for token in self._tokens)
+
+
+TOKEN_POOL = TokenPool()
+
+
+def rate_limited_request(
+    session: requests.Session,
+    method: str,
+    url: str,
+    **kwargs: Any,  # noqa: ANN401
+) -> requests.Response:
+    """Send a request once the shared rate limiter and a concurrency slot allow it.
+
+    When `TOKEN_POOL` holds tokens, the request is authorized with the next one.
+
+    Args:
+        session (requests.Session): The session used to send the request.
+        method (str): The HTTP method.
+        url (str): The request URL.
+        **kwargs: Extra arguments passed to `requests.Session.request`.
+
+    Returns:
+        requests.Response: The response object.
+    """
+    token = TOKEN_POOL.acquire()
+    if token:
+        headers = kwargs.get("headers") or {}
+        kwargs["headers"] = {**headers, "Authorization": f"Bearer {token}"}
+
+    resource = "graphql" if url == GITHUB_GRAPHQL_URL else "core"
+    RATE_LIMITER.wait(resource)
+    with _REQUEST_SLOTS:
+        response = session.request(method, url, **kwargs)
+
+    if token:
+        TOKEN_POOL.update(token, response)
+    else:
+        RATE_LIMITER.update(response)
+    return response
+
+
+def handle_rate_limit(response: requests.Response, attempt: int = 0) -> bool:
     """Handle GitHub API rate limiting by waiting if necessary.
 
+    The wait is shared through `RATE_LIMITER`, so other threads stop sending requests
+    until the limit resets as well. Secondary rate limits wait for `Retry-After` when
+    given, and otherwise back off exponentially with jitter.
+
     Args:
         response: The response object from a GitHub API request.
+        attempt: The zero-based attempt number of the request, used for backoff.
 
     Returns:
         bool: True if rate limited and waited, False otherwise.
     """
-    if response.status_code == 403:
-        reset_time = response.headers.get("X-RateLimit-Reset")
-        if reset_time:
-            sleep_time = max(int(reset_time) - time.time(), 0) + 1
-            logger.warning(f"Rate limit exceeded (403). Sleeping for {sleep_time:.0f} seconds.")
-            time.sleep(sleep_time)
-            return True
-
     remaining = response.headers.get("X-RateLimit-Remaining")
-    if remaining is not None and int(remaining) == 0:
+    exhausted = remaining is not None and int(remaining) == 0
+
+    if response.status_code in (403, 429) and not exhausted:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            sleep_time = int(retry_after) + random.uniform(0, 1)  # noqa: S311
+        elif response.status_code == 429 or "rate limit" in response.text.lower():
+            sleep_time = min(60, 2**attempt) + random.uniform(0, 1)  # noqa: S311
+        else:
+            return False
+
+        logger.warning(
+            f"Secondary rate limit hit ({response.status_code}). "
+            f"Sleeping for {sleep_time:.0f} seconds."
+        )
+        RATE_LIMITER.pause(sleep_time)
+        RATE_LIMITER.wait()
+        return True
+
+    if exhausted:
+        if TOKEN_POOL.has_available():
+            # Another token still has budget, so retry right away with that one.
+            return True
         reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
         sleep_time = max(reset_time - time.time(), 0) + 1
-        logger.warning(f"Rate limit exhausted. Sleeping for {sleep_time:.0f} seconds.")
-        time.sleep(sleep_time)
+        logger.warning(
+            f"Rate limit exhausted ({response.status_code}). "
+            f"Sleeping for {sleep_time:.0f} seconds."
+        )
+        RATE_LIMITER.pause(sleep_time)
+        RATE_LIMITER.wait()
         return True
 
     return False
 
 
-def fetch_organization_repositories_by_page(
+def _fetch_organization_repositories_page(
     session: requests.Session,
     github_token: str,
     organization_name: str,
     repository_type: RepositoryType = RepositoryType.ALL,
     page: int = 1,
     max_retries: int = 3,
-) -> list:
-    """Lists the repositories of a specified GitHub organization based on the repository
-    type and page number.
+) -> tuple[list, int | None] | None:
+    """Fetch a single page of an organization's repositories, retrying when rate
+    limited.
+
+    The request is made conditional on the ETag of the previous response for the same
+    page, and a `304 Not Modified` answer is served from `ETAG_CACHE`.
 
     Args:
+        session (requests.Session): The session used to send the request.
         github_token (str): The GitHub personal access token for authentication.
         organization_name (str): The name of the GitHub organization whose repositories
             are to be listed.
@@ -152,36 +531,55 @@ def fetch_organization_repositories_by_page(
         max_retries (int): Maximum number of retries for rate-limited requests.
 
     Returns:
-        List: A list containing details of the organization's repositories.
+        tuple[list, int | None] | None: The repositories on the page and the number of
+            the last page (None when unknown), or None if the retries were exhausted.
 
     Raises:
-        requests.HTTPError: If the API request fails after retries.
+        requests.HTTPError: If the API request fails with a non rate-limit error.
     """
-    headers = {
-        "Accept-Encoding": "gzip",
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {github_token}",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
+    headers = github_headers(github_token)
 
     params = {
         "type": repository_type.value,
         "page": page,
-        "per_page": 100,
+        "per_page": GITHUB_PER_PAGE,
     }
 
     url = f"https://api.github.com/orgs/{organization_name}/repos"
+    cache_key = f"{url}?type={repository_type.value}&page={page}"
+    cached = ETAG_CACHE.get(cache_key)
+    if cached:
+        headers = {**headers, "If-None-Match": cached[0]}
 
     for attempt in range(max_retries):
-        response = session.get(
-            url, headers=headers, params=params, timeout=HTTP_REQUEST_TIMEOUT
+        response = rate_limited_request(
+            session,
+            "GET",
+            url,
+            headers=headers,
+            params=params,
+            timeout=HTTP_REQUEST_TIMEOUT,
         )
 
+        if response.status_code == requests.codes.NOT_MODIFIED and cached:
+            payload = cached[1]
+            return payload["repositories"], payload["last_page"]
+
         if response.status_code == requests.codes.OK:
             handle_rate_limit(response)
-            return response.json()
+            repositories = orjson.loads(response.content)
+            last_page = _parse_last_page(response)
+            ETAG_CACHE.set(
+                cache_key,
+                response.headers.get("ETag"),
+                {
+                    "repositories": [_select_cached_fields(r) for r in repositories],
+                    "last_page": last_page,
+                },
+            )
+            return repositories, last_page
 
-        if handle_rate_limit(response):
+        if handle_rate_limit(response, attempt):
             logger.info(f"Retrying request for {organization_name} (attempt {attempt + 2})")
             continue
 
@@ -192,26 +590,47 @@ def fetch_organization_repositories_by_page(
         response.raise_for_status()
 
     logger.error(f"Max retries exceeded for {organization_name}")
-    return []
+    return None
 
 
-def convert_repositories_to_dataframe(
-    repositories: list[RepositoryData],
-) -> pd.DataFrame:
-    """Convert a list of RepositoryData objects into a pandas DataFrame.
+def fetch_organization_repositories_by_page(
+    session: requests.Session,
+    github_token: str,
+    organization_name: str,
+    repository_type: RepositoryType = RepositoryType.ALL,
+    page: int = 1,
+    max_retries: int = 3,
+) -> list:
+    """Lists the repositories of a specified GitHub organization based on the repository
+    type and page number.
 
-    Args:   
-        repositories (List[RepositoryData]): A list of RepositoryData objects.
+    Args:
+        session (requests.Session): The session used to send the request.
+        github_token (str): The GitHub personal access token for authentication.
+        organization_name (str): The name of the GitHub organization whose repositories
+            are to be listed.
+        repository_type (RepositoryType): The type of repositories to list. Defaults to
+            RepositoryType.ALL.
+        page (int): The page number of the results to fetch. Defaults to 1.
+        max_retries (int): Maximum number of retries for rate-limited requests.
 
     Returns:
-        pd.DataFrame: A DataFrame where each row represents a repository, with columns
-            for the repository's name and star count.
+        List: A list containing details of the organization's repositories.
+
+    Raises:
+        requests.HTTPError: If the API request fails after retries.
     """
-    data = [
-        {"full_name": repository.full_name, "star_count": repository.star_count}
-        for repository in repositories
-    ]
-    return pd.DataFrame(data)
+    result = _fetch_organization_repositories_page(
+        session=session,
+        github_token=github_token,
+        organization_name=organization_name,
+        repository_type=repository_type,
+        page=page,
+        max_retries=max_retries,
+    )
+    if result is None:
+        return []
+    return result[0]
 
 
 def fetch_repository_data_by_full_name(
@@ -230,22 +649,20 @@ def fetch_repository_data_by_full_name(
         Dict[str, Any]: A dictionary containing repository data if the request is
             successful, otherwise None.
     """
-    headers = {
-        "Accept-Encoding": "gzip",
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {github_token}",
-    }
+    headers = github_headers(github_token)
     url = f"https://api.github.com/repos/{repository_full_name}"
 
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=headers, timeout=HTTP_REQUEST_TIMEOUT)
+            response = rate_limited_request(
+                SESSION, "GET", url, headers=headers, timeout=HTTP_REQUEST_TIMEOUT
+            )
 
             if response.status_code == requests.codes.OK:
                 handle_rate_limit(response)
-                return response.json()
+                return orjson.loads(response.content)
 
-            if handle_rate_limit(response):
+            if handle_rate_limit(response, attempt):
                 logger.info(f"Retrying {repository_full_name} (attempt {attempt + 2})")
                 continue
 
@@ -262,3 +679,153 @@ def fetch_repository_data_by_full_name(
             return None
 
     return None
+
+
+def _build_repositories_query(repository_full_names: list[str]) -> dict[str, Any]:
+    """Build a GraphQL request that looks up several repositories through aliases.
+
+    Args:
+        repository_full_names (list[str]): Full names (owner/repo) of the repositories.
+
+    Returns:
+        dict[str, Any]: The JSON body of the GraphQL request.
+    """
+    declarations = []
+    selections = []
+    variables = {}
+    for index, full_name in enumerate(repository_full_names):
+        owner, _, name = full_name.partition("/")
+        declarations.append(f"$o{index}: String!, $n{index}: String!")
+        selections.append(
+            f"r{index}: repository(owner: $o{index}, name: $n{index}) "
+            "{ nameWithOwner stargazerCount forkCount }"
+        )
+        variables[f"o{index}"] = owner
+        variables[f"n{index}"] = name
+
+    query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+    return {"query": query, "variables": variables}
+
+
+def post_graphql_query(
+    github_token: str,
+    body: dict[str, Any],
+    max_retries: int = 3,
+) -> dict[str, Any] | None:
+    """Send a query to the GitHub GraphQL API, retrying when rate limited.
+
+    Rate limits reported as `RATE_LIMITED` errors are retried like HTTP ones. Other
+    errors in the response are logged as returned, alongside any partial data.
+
+    Args:
+        github_token (str): The GitHub personal access token for authentication.
+        body (dict[str, Any]): The request body with the `query` and its `variables`.
+        max_retries (int): Maximum number of retries for rate-limited requests.
+
+    Returns:
+        dict[str, Any] | None: The `data` member of the response (empty if the query
+            returned none), or None if the query failed with errors and no data, or the
+            retries were exhausted.
+
+    Raises:
+        requests.HTTPError: If the request fails with a non rate-limit error.
+    """
+    headers = {
+        "Authorization": f"Bearer {github_token}",
+        "Content-Type": "application/json",
+    }
+    data = orjson.dumps(body)
+
+    for attempt in range(max_retries):
+        response = rate_limited_request(
+            SESSION,
+            "POST",
+            GITHUB_GRAPHQL_URL,
+            headers=headers,
+            data=data,
+            timeout=HTTP_REQUEST_TIMEOUT,
+        )
+
+        if response.status_code == requests.codes.OK:
+            payload = orjson.loads(response.content)
+            errors = payload.get("errors") or []
+            if any(error.get("type") == "RATE_LIMITED" for error in errors):
+                # GitHub reports GraphQL rate limits with a `200 OK` and no data.
+                if not handle_rate_limit(response, attempt):
+                    sleep_time = min(60, 2**attempt) + random.uniform(0, 1)  # noqa: S311
+                    logger.warning(
+                        f"GraphQL query rate limited. Sleeping for {sleep_time:.0f} "
+                        "seconds."
+                    )
+                    RATE_LIMITER.pause(sleep_time)
+                    RATE_LIMITER.wait()
+                logger.info(f"Retrying GraphQL query (attempt {attempt + 2})")
+                continue
+
+            handle_rate_limit(response)
+            for error in errors:
+                logger.warning(f"GraphQL query error: {error.get('message', error)}")
+            data = payload.get("data")
+            if data is None and errors:
+                return None
+            return data or {}
+
+        if handle_rate_limit(response, attempt):
+            logger.info(f"Retrying GraphQL query (attempt {attempt + 2})")
+            continue
+
+        logger.error(
+            f"Failed to run GraphQL query: {response.status_code} - {response.text}"
+        )
+        response.raise_for_status()
+
+    logger.error("Max retries exceeded for GraphQL query")
+    return None
+
+
+def fetch_repositories_graphql(
+    github_token: str,
+    repository_full_names: list[str],
+    max_retries: int = 3,
+) -> list[RepositoryData]:
+    """Fetch data for several repositories with batched GitHub GraphQL queries.
+
+    Each query looks up to `GRAPHQL_BATCH_SIZE` repositories, replacing one REST call
+    per repository.
+
+    Args:
+        github_token (str): The GitHub personal access token for authentication.
+        repository_full_names (list[str]): Full names (owner/repo) of the repositories.
+        max_retries (int): Maximum number of retries for rate-limited requests.
+
+    Returns:
+        list[RepositoryData]: Data for every repository that could be found.
+
+    Raises:
+        requests.HTTPError: If a GraphQL request fails with a non rate-limit error.
+    """
+    repositories = []
+
+    for start in range(0, len(repository_full_names), GRAPHQL_BATCH_SIZE):
+        batch = repository_full_names[start : start + GRAPHQL_BATCH_SIZE]
+        data = post_graphql_query(
+            github_token, _build_repositories_query(batch), max_retries=max_retries
+        )
+        if data is None:
+            continue
+
+        for index, full_name in enumerate(batch):
+            repository = data.get(f"r{index}")
+            if not repository:
+                # The reason, e.g. a missing repository, is logged with the errors.
+                logger.warning(f"Failed to fetch repository {full_name}")
+                continue
+            repositories.append(
+                RepositoryData(
+                    full_name=repository["nameWithOwner"],
+                    star_count=repository["stargazerCount"],
+                    fork_count=repository["forkCount"],
+                )
+            )
+
+    return repositories
@@ -7,10 +7,77 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import os
 import sys
+from pathlib import Path
+
+import requests
+
+from startrack.config import (
+    DISCOVERY_MAX_WORKERS,
+    ETAG_CACHE_FILENAME,
+    GITHUB_TOKEN_ENV,
+    GITHUB_TOKENS_ENV,
+    RESPONSE_CACHE_FILENAME,
+)
+from startrack.core import (
+    ETAG_CACHE,
+    TOKEN_POOL,
+    RepositoryType,
+    fetch_all_organization_repositories,
+)
+from startrack.pypi import (
+    RESPONSE_CACHE,
+    fetch_organization_package_names,
+    fetch_package_name_from_repo,
+    fetch_pypi_downloads,
+)
+
+
+def _fetch_package_names_via_rest(
+    github_token: str,
+    org_name: str,
+    report: list[str],
+) -> list[tuple[str, str | None]]:
+    """List an organization's repositories and probe their build files over REST.
+
+    Args:
+        github_token: GitHub personal access token.
+        org_name: Name of the GitHub organization.
+        report: Output lines of the scan, to which skipped repositories are added.
+
+    Returns:
+        list: `(repo_full_name, package_name)` pairs for every non-fork repository.
+    """
+    repos = fetch_all_organization_repositories(
+        github_token=github_token,
+        organization_name=org_name,
+        repository_type=RepositoryType.PUBLIC,
+    )
+
+    repo_full_names = []
+    for repo in repos:
+        repo_full_name = repo.get("full_name", "")
+        repo_name = repo_full_name.split("/")[-1] if repo_full_name else "unknown"
 
-from startrack.core import RepositoryType, fetch_all_organization_repositories
-from startrack.pypi import fetch_package_name_from_repo, fetch_pypi_downloads
+        if repo.get("fork", False):
+            report.append(f"  [SKIP] {repo_name} (forked repo)")
+            continue
+
+        repo_full_names.append(repo_full_name)
+
+    # Probing build files is pure network wait, so look at all repositories at once
+    # and keep the results in repository order.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=DISCOVERY_MAX_WORKERS
+    ) as executor:
+        package_names = executor.map(
+            functools.partial(fetch_package_name_from_repo, github_token),
+            repo_full_names,
+        )
+        return list(zip(repo_full_names, package_names, strict=True))
 
 
 def discover_packages_for_org(
@@ -28,28 +95,25 @@ def discover_packages_for_org(
             - valid_packages: List of (package_name, repo_name) tuples
             - invalid_packages: List of (package_name, repo_name, reason) tuples
     """
-    print(f"\nScanning organization: {org_name}")
-    print("-" * 40)
-
-    repos = fetch_all_organization_repositories(
-        github_token=github_token,
-        organization_name=org_name,
-        repository_type=RepositoryType.PUBLIC,
-    )
+    # Collect the scan output and write it once per organization, rather than
+    # flushing a line to stdout for every repository.
+    report = [f"\nScanning organization: {org_name}", "-" * 40]
 
     valid_packages = []
     invalid_packages = []
     seen_packages = set()
 
-    for repo in repos:
-        repo_full_name = repo.get("full_name", "")
-        repo_name = repo_full_name.split("/")[-1] if repo_full_name else "unknown"
+    try:
+        repo_packages = fetch_organization_package_names(github_token, org_name)
+    except requests.RequestException as e:
+        report.append(f"  [WARN] GraphQL lookup failed ({e}), falling back to REST")
+        repo_packages = None
 
-        if repo.get("fork", False):
-            print(f"  [SKIP] {repo_name} (forked repo)")
-            continue
+    if repo_packages is None:
+        repo_packages = _fetch_package_names_via_rest(github_token, org_name, report)
 
-        package_name = fetch_package_name_from_repo(github_token, repo_full_name)
+    for repo_full_name, package_name in repo_packages:
+        repo_name = repo_full_name.split("/")[-1] if repo_full_name else "unknown"
 
         if not package_name:
             continue
@@ -58,17 +122,18 @@ def discover_packages_for_org(
             continue
         seen_packages.add(package_name)
 
-        print(f"  [CHECK] {package_name} (from {repo_name})...", end=" ")
+        check = f"  [CHECK] {package_name} (from {repo_name})..."
 
         downloads = fetch_pypi_downloads(package_name)
 
         if downloads is not None:
-            print(f"OK ({downloads:,} daily downloads)")
+            report.append(f"{check} OK ({downloads:,} daily downloads)")
             valid_packages.append((package_name, repo_name))
         else:
-            print("NOT FOUND on PyPI")
+            report.append(f"{check} NOT FOUND on PyPI")
             invalid_packages.append((package_name, repo_name, "404 - not on PyPI"))
 
+    sys.stdout.write("\n".join(report) + "\n")
     return valid_packages, invalid_packages
 
 
@@ -92,43 +157,70 @@ Examples:
     parser.add_argument(
         "--token",
         default=None,
-        help="GitHub token (or set GITHUB_TOKEN env var)",
+        help=(
+            "GitHub token (or set GITHUB_TOKEN env var). Set GITHUB_TOKENS to a "
+            "comma-separated list to rotate requests across several tokens"
+        ),
     )
 
     args = parser.parse_args()
 
-    import os
-
-    github_token = args.token or os.environ.get("GITHUB_TOKEN")
+    github_tokens = [
+        token.strip()
+        for token in os.environ.get(GITHUB_TOKENS_ENV, "").split(",")
+        if token.strip()
+    ]
+    github_token = args.token or os.environ.get(GITHUB_TOKEN_ENV)
+    if not github_token and github_tokens:
+        github_token = github_tokens[0]
 
     if not github_token:
         print("Error: GitHub token required. Use --token or set GITHUB_TOKEN env var.")
         sys.exit(1)
 
-    all_valid = []
-    all_invalid = []
+    if github_tokens:
+        # Rotate requests across all tokens to multiply the available rate limit.
+        TOKEN_POOL.configure([github_token, *github_tokens])
+
+    # Keyed by package name, so packages published from several orgs are listed once.
+    all_valid: dict[str, str] = {}
+    all_invalid: dict[str, tuple[str, str]] = {}
+
+    # Build files and download counts rarely change, so reuse them across runs and
+    # revalidate expired GitHub responses with their ETags.
+    cache_path = Path(RESPONSE_CACHE_FILENAME)
+    etag_cache_path = Path(ETAG_CACHE_FILENAME)
+    RESPONSE_CACHE.load(cache_path)
+    ETAG_CACHE.load(etag_cache_path)
 
     for org in args.organizations:
         valid, invalid = discover_packages_for_org(github_token, org)
-        all_valid.extend(valid)
-        all_invalid.extend(invalid)
+        for pkg, repo in valid:
+            all_valid.setdefault(pkg, repo)
+        for pkg, repo, reason in invalid:
+            all_invalid.setdefault(pkg, (repo, reason))
+
+    RESPONSE_CACHE.save(cache_path)
+    ETAG_CACHE.save(etag_cache_path)
 
     print("\n" + "=" * 50)
     print("DISCOVERY SUMMARY")
     print("=" * 50)
 
+    valid_packages = sorted(all_valid)
+
     if all_valid:
         print(f"\nFound {len(all_valid)} packages on PyPI:")
-        for pkg, repo in sorted(all_valid):
-            print(f"  - {pkg} (from {repo})")
+        for pkg in valid_packages:
+            print(f"  - {pkg} (from {all_valid[pkg]})")
 
     if all_invalid:
         print(f"\nNot on PyPI ({len(all_invalid)} packages):")
-        for pkg, repo, reason in sorted(all_invalid):
+        for pkg, (repo, reason) in sorted(all_invalid.items()):
             print(f"  - {pkg} (from {repo}): {reason}")
 
     if all_valid:
-        package_list = ",".join(sorted(pkg for pkg, _ in all_valid))
+        package_list = ",".join(valid_packages)
         print("\n" + "-" * 50)
         print("Suggested configuration:")
         print("-" * 50)
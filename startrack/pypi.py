@@ -1,7 +1,13 @@
-import base64
+import concurrent.futures
+import configparser
+import functools
 import logging
+import random
+import re
+import time
 from dataclasses import dataclass
 
+import orjson
 import requests
 
 try:
@@ -9,13 +15,46 @@ try:
 except ImportError:
     import tomli as tomllib
 
-from startrack.config import HTTP_REQUEST_TIMEOUT
+from startrack.cache import ResponseCache
+from startrack.config import (
+    GITHUB_FILE_CACHE_TTL,
+    GRAPHQL_BATCH_SIZE,
+    HTTP_REQUEST_TIMEOUT,
+    PYPI_MAX_RETRY_AFTER,
+    PYPI_MAX_WORKERS,
+    PYPI_STATS_CACHE_TTL,
+)
+from startrack.core import (
+    ETAG_CACHE,
+    SESSION,
+    github_headers,
+    handle_rate_limit,
+    post_graphql_query,
+    rate_limited_request,
+)
 
 logger = logging.getLogger(__name__)
 
 PYPISTATS_API_URL = "https://pypistats.org/api/packages"
 GITHUB_RAW_CONTENT_URL = "https://api.github.com/repos"
 
+RESPONSE_CACHE = ResponseCache()
+
+# Locate the `[project]` table of a pyproject.toml, the header of the table following
+# it, and a plain string `name` key within it.
+_PYPROJECT_PROJECT_TABLE_RE = re.compile(r"^\[project\][ \t]*(?:#.*)?$", re.MULTILINE)
+_TOML_TABLE_HEADER_RE = re.compile(r"^[ \t]*\[", re.MULTILINE)
+_PYPROJECT_NAME_RE = re.compile(
+    r"""^[ \t]*name[ \t]*=[ \t]*(?:"([^"\\\n]+)"|'([^'\n]+)')""", re.MULTILINE
+)
+
+# Patterns for the name passed to `setup()`, in order of preference: a quoted
+# `name="..."` anywhere in the file wins over a bare `name=IDENTIFIER`.
+_SETUP_PY_NAME_PATTERNS = (
+    re.compile(r'name\s*=\s*["\']([^"\']+)["\']'),
+    re.compile(r"name\s*=\s*([a-zA-Z_][a-zA-Z0-9_-]*)"),
+)
+
 
 @dataclass
 class PyPIPackageData:
@@ -30,31 +69,61 @@ class PyPIPackageData:
     daily_downloads: int
 
 
-def fetch_pypi_downloads(package_name: str) -> int | None:
+def fetch_pypi_downloads(package_name: str, max_retries: int = 3) -> int | None:
     """Fetch daily download count for a PyPI package.
 
+    Successful lookups are kept in `RESPONSE_CACHE` for `PYPI_STATS_CACHE_TTL` seconds.
+    Throttled requests (`429`) wait for `Retry-After`, or back off exponentially, and
+    are retried up to `max_retries` times.
+
     Args:
         package_name (str): The name of the PyPI package.
+        max_retries (int): Maximum number of attempts for throttled requests.
 
     Returns:
         int | None: The daily download count, or None if the request fails.
     """
+    cache_key = f"pypi:{package_name}"
+    hit, downloads = RESPONSE_CACHE.get(cache_key, max_age=PYPI_STATS_CACHE_TTL)
+    if hit:
+        return downloads
+
     url = f"{PYPISTATS_API_URL}/{package_name}/recent"
     params = {"period": "day"}
 
     try:
-        response = requests.get(url, params=params, timeout=HTTP_REQUEST_TIMEOUT)
-
-        if response.status_code == requests.codes.OK:
-            data = response.json()
-            return data.get("data", {}).get("last_day")
+        for attempt in range(max_retries):
+            response = SESSION.get(url, params=params, timeout=HTTP_REQUEST_TIMEOUT)
+
+            if response.status_code == requests.codes.OK:
+                data = orjson.loads(response.content)
+                downloads = data.get("data", {}).get("last_day")
+                if downloads is not None:
+                    RESPONSE_CACHE.set(cache_key, downloads)
+                return downloads
+
+            last_attempt = attempt == max_retries - 1
+            if response.status_code != requests.codes.TOO_MANY_REQUESTS or last_attempt:
+                break
+
+            sleep_time = 2**attempt
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                sleep_time = int(retry_after)
+            jitter = random.uniform(0, 1)  # noqa: S311
+            sleep_time = min(PYPI_MAX_RETRY_AFTER, sleep_time) + jitter
+            logger.warning(
+                f"PyPI stats for {package_name} throttled. "
+                f"Sleeping for {sleep_time:.0f} seconds."
+            )
+            time.sleep(sleep_time)
 
         logger.warning(
             f"Failed to fetch PyPI stats for {package_name}: "
             f"{response.status_code} - {response.text}"
         )
         return None
-    except requests.RequestException as e:
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         logger.error(f"Request error fetching PyPI stats for {package_name}: {e}")
         return None
 
@@ -63,37 +132,82 @@ def _fetch_github_file_content(
     github_token: str,
     repo_full_name: str,
     file_path: str,
+    max_retries: int = 3,
 ) -> str | None:
     """Fetch and decode a file from a GitHub repository.
 
+    The file is requested with the raw media type, so its bytes arrive as the body
+    instead of base64-encoded inside a JSON envelope.
+
+    Contents, and files known to be missing, are kept in `RESPONSE_CACHE` for
+    `GITHUB_FILE_CACHE_TTL` seconds. After that the file is revalidated with its ETag,
+    and a `304 Not Modified` answer, which is free of rate-limit cost, reuses it.
+
     Args:
         github_token: The GitHub personal access token.
         repo_full_name: The full name of the repository (owner/repo).
         file_path: Path to the file in the repository.
+        max_retries: Maximum number of retries for rate-limited requests.
 
     Returns:
         The decoded file content, or None if not found.
     """
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {github_token}",
-    }
+    headers = {**github_headers(github_token), "Accept": "application/vnd.github.raw"}
     url = f"{GITHUB_RAW_CONTENT_URL}/{repo_full_name}/contents/{file_path}"
+    cache_key = f"github:{repo_full_name}:{file_path}"
+    hit, content = RESPONSE_CACHE.get(cache_key, max_age=GITHUB_FILE_CACHE_TTL)
+    if hit:
+        return content
+
+    cached = ETAG_CACHE.get(url)
+    if cached:
+        headers["If-None-Match"] = cached[0]
 
     try:
-        response = requests.get(url, headers=headers, timeout=HTTP_REQUEST_TIMEOUT)
+        for attempt in range(max_retries):
+            response = rate_limited_request(
+                SESSION, "GET", url, headers=headers, timeout=HTTP_REQUEST_TIMEOUT
+            )
+            if response.status_code == requests.codes.OK:
+                handle_rate_limit(response)
+                break
+            if not handle_rate_limit(response, attempt):
+                break
+
+        if response.status_code == requests.codes.NOT_MODIFIED and cached:
+            content = cached[1]
+            RESPONSE_CACHE.set(cache_key, content)
+            return content
+        if response.status_code == requests.codes.NOT_FOUND:
+            RESPONSE_CACHE.set(cache_key, None)
+            return None
         if response.status_code != requests.codes.OK:
             return None
 
-        data = response.json()
-        content = data.get("content", "")
-        return base64.b64decode(content).decode("utf-8")
+        content = response.content.decode("utf-8")
+        RESPONSE_CACHE.set(cache_key, content)
+        ETAG_CACHE.set(url, response.headers.get("ETag"), content)
+        return content
     except (requests.RequestException, UnicodeDecodeError):
         return None
 
 
 def _extract_name_from_pyproject(content: str) -> str | None:
-    """Extract package name from pyproject.toml content."""
+    """Extract package name from pyproject.toml content.
+
+    A plain `name = "..."` in the `[project]` table is matched directly, so the whole
+    file is only parsed as TOML when that fast path fails.
+    """
+    project = _PYPROJECT_PROJECT_TABLE_RE.search(content)
+    if project:
+        table = content[project.end() :]
+        next_table = _TOML_TABLE_HEADER_RE.search(table)
+        if next_table:
+            table = table[: next_table.start()]
+        match = _PYPROJECT_NAME_RE.search(table)
+        if match:
+            return match.group(1) or match.group(2)
+
     try:
         pyproject = tomllib.loads(content)
         name = pyproject.get("project", {}).get("name")
@@ -106,14 +220,8 @@ def _extract_name_from_pyproject(content: str) -> str | None:
 
 def _extract_name_from_setup_py(content: str) -> str | None:
     """Extract package name from setup.py content using regex."""
-    import re
-
-    patterns = [
-        r'name\s*=\s*["\']([^"\']+)["\']',
-        r'name\s*=\s*([a-zA-Z_][a-zA-Z0-9_-]*)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, content)
+    for pattern in _SETUP_PY_NAME_PATTERNS:
+        match = pattern.search(content)
         if match:
             return match.group(1)
     return None
@@ -121,9 +229,6 @@ def _extract_name_from_setup_py(content: str) -> str | None:
 
 def _extract_name_from_setup_cfg(content: str) -> str | None:
     """Extract package name from setup.cfg content."""
-    import configparser
-    import io
-
     try:
         config = configparser.ConfigParser()
         config.read_string(content)
@@ -132,13 +237,42 @@ def _extract_name_from_setup_cfg(content: str) -> str | None:
         return None
 
 
+# Build files that may declare the package name, in order of precedence.
+BUILD_FILE_PARSERS = (
+    ("pyproject.toml", _extract_name_from_pyproject),
+    ("setup.py", _extract_name_from_setup_py),
+    ("setup.cfg", _extract_name_from_setup_cfg),
+)
+
+
+def _extract_package_name(contents: dict[str, str | None]) -> str | None:
+    """Extract the package name from build file contents, in order of precedence.
+
+    Args:
+        contents (dict[str, str | None]): File contents keyed by build file name.
+
+    Returns:
+        str | None: The package name if found, otherwise None.
+    """
+    for file_path, parser in BUILD_FILE_PARSERS:
+        content = contents.get(file_path)
+        if content:
+            name = parser(content)
+            if name:
+                return name
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
 def fetch_package_name_from_repo(
     github_token: str,
     repo_full_name: str,
 ) -> str | None:
     """Extract PyPI package name from a GitHub repository.
 
-    Checks pyproject.toml, setup.py, and setup.cfg in order.
+    Fetches pyproject.toml, setup.py, and setup.cfg concurrently and checks them in
+    that order. Results are memoized for the rest of the process, so each repository
+    is only looked up once.
 
     Args:
         github_token (str): The GitHub personal access token for authentication.
@@ -147,25 +281,99 @@ def fetch_package_name_from_repo(
     Returns:
         str | None: The package name if found, otherwise None.
     """
-    content = _fetch_github_file_content(github_token, repo_full_name, "pyproject.toml")
-    if content:
-        name = _extract_name_from_pyproject(content)
-        if name:
-            return name
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(BUILD_FILE_PARSERS)
+    ) as executor:
+        futures = [
+            executor.submit(
+                _fetch_github_file_content, github_token, repo_full_name, file_path
+            )
+            for file_path, _ in BUILD_FILE_PARSERS
+        ]
+
+    contents = {
+        file_path: future.result()
+        for (file_path, _), future in zip(BUILD_FILE_PARSERS, futures, strict=True)
+    }
+    return _extract_package_name(contents)
+
+
+# Lists an organization's non-fork public repositories together with the text of
+# each build file in BUILD_FILE_PARSERS, aliased as in ORGANIZATION_BUILD_FILE_ALIASES.
+ORGANIZATION_BUILD_FILES_QUERY = """
+query($org: String!, $first: Int!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: $first, after: $cursor, isFork: false, privacy: PUBLIC) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        nameWithOwner
+        pyproject: object(expression: "HEAD:pyproject.toml") { ... on Blob { text } }
+        setuppy: object(expression: "HEAD:setup.py") { ... on Blob { text } }
+        setupcfg: object(expression: "HEAD:setup.cfg") { ... on Blob { text } }
+      }
+    }
+  }
+}
+"""
+ORGANIZATION_BUILD_FILE_ALIASES = {
+    "pyproject.toml": "pyproject",
+    "setup.py": "setuppy",
+    "setup.cfg": "setupcfg",
+}
 
-    content = _fetch_github_file_content(github_token, repo_full_name, "setup.py")
-    if content:
-        name = _extract_name_from_setup_py(content)
-        if name:
-            return name
 
-    content = _fetch_github_file_content(github_token, repo_full_name, "setup.cfg")
-    if content:
-        name = _extract_name_from_setup_cfg(content)
-        if name:
-            return name
+def fetch_organization_package_names(
+    github_token: str,
+    org_name: str,
+) -> list[tuple[str, str | None]] | None:
+    """Extract PyPI package names for all repositories of an organization via GraphQL.
 
-    return None
+    Repositories and their build files are read in the same paginated query, instead
+    of listing the repositories and then probing each file with a REST call.
+
+    Args:
+        github_token (str): The GitHub personal access token for authentication.
+        org_name (str): The name of the GitHub organization.
+
+    Returns:
+        list[tuple[str, str | None]] | None: `(repo_full_name, package_name)` pairs
+            for every non-fork public repository, with None for repositories without
+            a package name, or None if the organization could not be queried.
+
+    Raises:
+        requests.HTTPError: If a GraphQL request fails with a non rate-limit error.
+    """
+    results = []
+    cursor = None
+
+    while True:
+        data = post_graphql_query(
+            github_token,
+            {
+                "query": ORGANIZATION_BUILD_FILES_QUERY,
+                "variables": {
+                    "org": org_name,
+                    "first": GRAPHQL_BATCH_SIZE,
+                    "cursor": cursor,
+                },
+            },
+        )
+        organization = (data or {}).get("organization")
+        if not organization:
+            return None
+
+        repositories = organization["repositories"]
+        for node in repositories["nodes"]:
+            contents = {
+                file_path: (node.get(alias) or {}).get("text")
+                for file_path, alias in ORGANIZATION_BUILD_FILE_ALIASES.items()
+            }
+            results.append((node["nameWithOwner"], _extract_package_name(contents)))
+
+        page_info = repositories["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return results
+        cursor = page_info["endCursor"]
 
 
 def discover_pypi_packages_from_org(
@@ -205,7 +413,7 @@ def discover_pypi_packages_from_org(
 
 
 def fetch_all_pypi_stats(packages: list[str]) -> list[PyPIPackageData]:
-    """Fetch download stats for a list of PyPI packages.
+    """Fetch download stats for a list of PyPI packages concurrently.
 
     Args:
         packages (list[str]): List of package names.
@@ -213,16 +421,18 @@ def fetch_all_pypi_stats(packages: list[str]) -> list[PyPIPackageData]:
     Returns:
         list[PyPIPackageData]: List of package data with download counts.
     """
-    results = []
-    seen = set()
-
-    for package_name in packages:
-        if package_name in seen:
-            continue
-        seen.add(package_name)
-
-        downloads = fetch_pypi_downloads(package_name)
-        if downloads is not None:
-            results.append(PyPIPackageData(name=package_name, daily_downloads=downloads))
-
-    return results
+    unique_packages = list(dict.fromkeys(packages))
+    if not unique_packages:
+        return []
+
+    max_workers = min(len(unique_packages), PYPI_MAX_WORKERS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        downloads = list(executor.map(fetch_pypi_downloads, unique_packages))
+
+    return [
+        PyPIPackageData(name=package_name, daily_downloads=package_downloads)
+        for package_name, package_downloads in zip(
+            unique_packages, downloads, strict=True
+        )
+        if package_downloads is not None
+    ]